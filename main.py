@@ -141,7 +141,7 @@ def main():
     
     # Sentiment analysis
     print("\n[2/8] Performing sentiment analysis...")
-    df = analyze_sentiment_batch(df)
+    df = analyze_sentiment_batch(df, n_jobs=-1)  # Batch CLI run: use every CPU
     df = add_sentiment_categories(df)
     df = calculate_impact_score(df)
     
@@ -15,7 +15,7 @@ import json
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.youtube_monitor import YouTubeSentimentMonitor
+from src.youtube_monitor import YouTubeSentimentMonitor, format_alert_message
 from src.config import DEFAULT_YOUTUBE_API_KEY
 
 
@@ -144,7 +144,7 @@ class MonitoringService:
                 if len(alerts_df) > 0:
                     print(f"\n🚨 {len(alerts_df)} alert(s) in the last hour:")
                     for _, alert in alerts_df.head(5).iterrows():
-                        print(f"   - {alert['message']}")
+                        print(f"   - {format_alert_message(alert['alert_type'], alert['message'])}")
                 
             except Exception as e:
                 print(f"❌ Error during monitoring: {e}")
@@ -18,7 +18,7 @@ import gc  # Garbage collection for memory management
 sys.path.insert(0, str(Path(__file__).parent))
 
 try:
-    from src.youtube_monitor import YouTubeSentimentMonitor
+    from src.youtube_monitor import YouTubeSentimentMonitor, format_alert_message
     from src.config import DEFAULT_YOUTUBE_API_KEY
     MONITOR_AVAILABLE = True
 except ImportError as e:
@@ -452,7 +452,8 @@ def main():
                 
                 with st.spinner(f"Analyzing up to {max_comments} comments..."):
                     # Use analyze_video_comments to get detailed results with comments_df
-                    result = monitor.analyze_video_comments(st.session_state['analyze_video'], max_comments=max_comments)
+                    result = monitor.analyze_video_comments(st.session_state['analyze_video'], max_comments=max_comments,
+                                                            include_comments=True)
                     
                     if result['status'] == 'success':
                         # Save snapshot to database for Sentiment History
@@ -930,7 +931,7 @@ def main():
                 st.markdown(f"""
                 <div class="alert-box {alert_class}">
                     <strong>{alert['alert_type']}</strong> - {video_title}<br>
-                    {alert['message']}<br>
+                    {format_alert_message(alert['alert_type'], alert['message'])}<br>
                     <small>Video ID: {alert['video_id']} | {alert['timestamp']}</small>
                 </div>
                 """, unsafe_allow_html=True)
@@ -972,9 +973,6 @@ def main():
                         st.info(f"Video ID used: `{video_id}`")
                         if video_input != video_id:
                             st.caption(f"Original input: `{video_input}`")
-                    elif result['status'] == 'analysis_failed':
-                        st.error("❌ Failed to analyze comments. Please check the video ID and try again.")
-                        st.info(f"Video ID used: `{video_id}`")
                     elif result['status'] == 'success':
                         st.success("✅ Analysis complete!")
                         
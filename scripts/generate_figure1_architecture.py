@@ -2,7 +2,12 @@
 """
 Generate Figure 1: System Architecture Diagram for YouTube Sentiment Analysis.
 Saves to screenshots/Figure1_System_Architecture.png
+
+Rendering is skipped when the PNG is newer than this script. Routine runs
+render at 150 DPI; pass --hi-res for the 300 DPI publication render.
 """
+import argparse
+import sys
 import matplotlib
 matplotlib.use('Agg')
 import matplotlib.pyplot as plt
@@ -17,6 +22,18 @@ OUTPUT_DIR = os.path.join(PROJECT_ROOT, 'screenshots')
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 OUTPUT_FILE = os.path.join(OUTPUT_DIR, 'Figure1_System_Architecture.png')
 
+parser = argparse.ArgumentParser(description='Generate Figure 1: System Architecture Diagram')
+parser.add_argument('--hi-res', action='store_true',
+                    help='Render at 300 DPI for publication (always re-renders)')
+args = parser.parse_args()
+dpi = 300 if args.hi_res else 150
+
+# The diagram is fully determined by this script, so skip if output is current
+script_mtime = os.path.getmtime(__file__)
+if not args.hi_res and os.path.exists(OUTPUT_FILE) and os.path.getmtime(OUTPUT_FILE) >= script_mtime:
+    print(f'Figure 1 up to date: {OUTPUT_FILE}')
+    sys.exit(0)
+
 # Figure setup
 fig, ax = plt.subplots(1, 1, figsize=(12, 10))
 ax.set_xlim(0, 10)
@@ -91,6 +108,6 @@ ax.text(5, 13.75, 'YouTube Sentiment Analysis — System Architecture', fontsize
        fontweight='bold', color=text_dark)
 
 plt.tight_layout()
-plt.savefig(OUTPUT_FILE, dpi=300, bbox_inches='tight', facecolor='white')
+fig.savefig(OUTPUT_FILE, dpi=dpi, bbox_inches='tight', facecolor='white')
 plt.close()
 print(f'Figure 1 saved to: {OUTPUT_FILE}')
@@ -18,6 +18,9 @@ OUTPUT_DIR = PROJECT_ROOT / "output"
 REPORTS_DIR = OUTPUT_DIR / "reports"
 FIGURES_DIR = OUTPUT_DIR / "figures"
 DATABASE_PATH = OUTPUT_DIR / "youtube_sentiment_analysis.db"
+TFIDF_MODEL_PATH = OUTPUT_DIR / "tfidf_sentiment_model.pkl"
+# Model for the 'hf' sentiment backend (binary POSITIVE/NEGATIVE classifier)
+HF_SENTIMENT_MODEL = "distilbert/distilbert-base-uncased-finetuned-sst-2-english"
 
 # Create output directories if they don't exist
 OUTPUT_DIR.mkdir(exist_ok=True)
@@ -28,6 +31,8 @@ FIGURES_DIR.mkdir(exist_ok=True)
 SAMPLE_SIZE = 1000  # Number of comments to analyze (None for all)
 SENTIMENT_THRESHOLD_POSITIVE = 0.1
 SENTIMENT_THRESHOLD_NEGATIVE = -0.1
+PARALLEL_MIN_COMMENTS = 5000  # Below this, process-pool startup outweighs the gain
+MIN_COMMENTS_FOR_ANALYSIS = 1  # Videos with fewer fetched comments skip sentiment analysis
 
 # Topic modeling parameters
 N_TOPICS = 5
@@ -43,3 +48,5 @@ DB_NAME = "youtube_sentiment_analysis.db"
 # YouTube API Configuration
 # Set via environment variable YOUTUBE_API_KEY or in dashboard UI
 DEFAULT_YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY", "")
+ANALYSIS_CACHE_TTL = 600  # Seconds a video's analysis summary is reused before refetching
+ANALYSIS_CACHE_SIZE = 256  # Most video analysis summaries kept (least recently used evicted)
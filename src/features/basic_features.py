@@ -7,7 +7,7 @@ import emoji
 from collections import Counter
 from scipy import stats
 
-from ..utils import extract_emojis, calculate_comment_metrics, get_word_sentiment_mapping
+from ..utils import extract_emojis_series, calculate_comment_metrics, get_word_sentiment_mapping
 
 
 def analyze_emoji_sentiment(df):
@@ -20,17 +20,10 @@ def analyze_emoji_sentiment(df):
     Returns:
         DataFrame with emoji sentiment analysis
     """
-    emoji_sentiment = []
-    
-    for idx, row in df.iterrows():
-        comment = str(row['comment_text'])
-        sentiment = row['Polarity']
-        emojis_in_comment = extract_emojis(comment)
-        
-        for emoji_char in emojis_in_comment:
-            emoji_sentiment.append({'emoji': emoji_char, 'sentiment': sentiment})
-    
-    emoji_df = pd.DataFrame(emoji_sentiment)
+    emoji_df = pd.DataFrame({
+        'emoji': extract_emojis_series(df['comment_text']),
+        'sentiment': df['Polarity']
+    }).explode('emoji').dropna(subset=['emoji'])
     
     if len(emoji_df) > 0:
         emoji_sentiment_avg = emoji_df.groupby('emoji')['sentiment'].agg(['mean', 'count']).reset_index()
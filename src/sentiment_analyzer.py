@@ -1,12 +1,45 @@
 """
-Sentiment analysis module using TextBlob
+Sentiment analysis module using TextBlob (with optional VADER / HuggingFace / TF-IDF backends)
 """
+import multiprocessing as mp
+import pickle
+import re
+from functools import lru_cache
 import pandas as pd
 import numpy as np
-from textblob import TextBlob
+from textblob._text import EMOTICONS
+from textblob.en import sentiment as pattern_sentiment
 from tqdm import tqdm
 
-from .config import SENTIMENT_THRESHOLD_POSITIVE, SENTIMENT_THRESHOLD_NEGATIVE
+try:
+    import swifter  # noqa: F401 - registers the .swifter accessor
+    SWIFTER_AVAILABLE = True
+except ImportError:
+    SWIFTER_AVAILABLE = False
+
+try:
+    import numexpr as ne
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
+
+from .utils import as_arrow_strings
+from .config import (
+    SENTIMENT_THRESHOLD_POSITIVE, SENTIMENT_THRESHOLD_NEGATIVE, PARALLEL_MIN_COMMENTS,
+    TFIDF_MODEL_PATH, HF_SENTIMENT_MODEL
+)
+
+# Characters the lexicon scorer can use: letters (words), ASCII punctuation
+# (emoticons such as ":)" or "<3") and the non-ASCII symbols of TextBlob's
+# emoticon table (e.g. "\u2665"). Comments with none of them always score 0.
+_EMOTICON_SYMBOLS = ''.join(sorted(
+    {char for emoticons in EMOTICONS.values() for emoticon in emoticons for char in emoticon
+     if not char.isascii() and not char.isalnum()}
+))
+_SCORABLE_RE = re.compile(r"[^\W\d_]|[!-/:-@\[-`{-~" + re.escape(_EMOTICON_SYMBOLS) + "]")
+
+SENTIMENT_CATEGORIES = ['Very Negative', 'Negative', 'Neutral', 'Positive', 'Very Positive']
+SENTIMENT_CATEGORY_DTYPE = pd.CategoricalDtype(SENTIMENT_CATEGORIES, ordered=True)
 
 
 def calculate_sentiment(comment_text):
@@ -19,34 +52,187 @@ def calculate_sentiment(comment_text):
     Returns:
         Sentiment polarity score (-1 to 1)
     """
+    text = str(comment_text)
+    # Fast path for emoji-only, numeric and blank comments
+    if not _SCORABLE_RE.search(text):
+        return 0.0
     try:
-        return TextBlob(str(comment_text)).sentiment.polarity
+        # Same lexicon scorer TextBlob(...).sentiment uses, called directly to
+        # skip building a TextBlob and a namedtuple class per comment
+        return pattern_sentiment(text)[0]
     except:
         return 0.0
 
 
-def analyze_sentiment_batch(comments_df, show_progress=True):
+def _textblob_polarity(texts, show_progress=True, n_jobs=None, use_swifter=False):
+    """
+    Score a Series of comment texts with TextBlob
+    
+    With n_jobs > 1 (or -1 for all CPUs), large batches are scored across a
+    process pool; small ones stay serial so they don't pay the pool startup
+    cost. Without n_jobs, scoring is always serial.
+    """
+    if n_jobs == -1:
+        n_jobs = mp.cpu_count()
+    if use_swifter and SWIFTER_AVAILABLE and len(texts) >= PARALLEL_MIN_COMMENTS:
+        try:
+            return (texts.swifter
+                    .allow_dask_on_strings(True)
+                    .progress_bar(show_progress)
+                    .apply(calculate_sentiment))
+        except TypeError as e:
+            # swifter<=1.4 passes Series.apply's convert_dtype, which pandas>=3
+            # forwards to the function; fall back to the pool/serial path
+            if 'convert_dtype' not in str(e):
+                raise
+    if n_jobs is not None and n_jobs > 1 and len(texts) >= PARALLEL_MIN_COMMENTS:
+        with mp.Pool(n_jobs) as pool:
+            results = pool.imap(calculate_sentiment, texts.tolist(), chunksize=1024)
+            if show_progress:
+                results = tqdm(results, total=len(texts), desc="Processing comments")
+            return list(results)
+    if show_progress:
+        tqdm.pandas(desc="Processing comments")
+        return texts.progress_apply(calculate_sentiment)
+    return texts.apply(calculate_sentiment)
+
+
+@lru_cache(maxsize=1)
+def _load_vader():
+    """Build (once per process) the VADER analyzer"""
+    try:
+        from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+    except ImportError:
+        raise ImportError("vaderSentiment not installed. Install with: pip install vaderSentiment")
+    return SentimentIntensityAnalyzer()
+
+
+def _vader_polarity(texts):
+    """Score comment texts with VADER's compound score (-1 to 1)"""
+    analyzer = _load_vader()
+    return [analyzer.polarity_scores(text)['compound'] for text in texts]
+
+
+@lru_cache(maxsize=2)
+def _load_hf_pipeline(model_name):
+    """Load (once per process) a HuggingFace sentiment pipeline"""
+    try:
+        from transformers import pipeline
+    except ImportError:
+        raise ImportError("transformers not installed. Install with: pip install transformers")
+    return pipeline("sentiment-analysis", model=model_name)
+
+
+def _hf_polarity(texts, batch_size=64, model_name=None):
+    """Score comment texts with a batched HuggingFace sentiment pipeline (-1 to 1)"""
+    pipe = _load_hf_pipeline(model_name or HF_SENTIMENT_MODEL)
+    results = pipe(texts.tolist(), batch_size=batch_size, truncation=True)
+    # The score is the winning label's probability (>= 0.5), so map it to
+    # 2 * P(positive) - 1: POSITIVE -> 2*score - 1, NEGATIVE -> 1 - 2*score
+    return [2 * r['score'] - 1 if r['label'].upper().startswith('POS') else 1 - 2 * r['score']
+            for r in results]
+
+
+def train_tfidf_model(texts, polarity=None, model_path=None):
+    """
+    Fit a TF-IDF + Ridge model that predicts polarity, and save it for the
+    'tfidf' backend
+    
+    Args:
+        texts: Iterable of comment texts
+        polarity: Target polarity scores (default: TextBlob polarity of texts)
+        model_path: Where to pickle the fitted model (default: TFIDF_MODEL_PATH)
+    
+    Returns:
+        Fitted scikit-learn pipeline
+    """
+    try:
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from sklearn.linear_model import Ridge
+        from sklearn.pipeline import make_pipeline
+    except ImportError:
+        raise ImportError("scikit-learn not installed. Install with: pip install scikit-learn")
+    
+    texts = pd.Series(texts).fillna('').astype(str)
+    if polarity is None:
+        polarity = texts.map(calculate_sentiment)
+    
+    model = make_pipeline(TfidfVectorizer(ngram_range=(1, 2), min_df=2, sublinear_tf=True), Ridge())
+    model.fit(texts, polarity)
+    
+    model_path = model_path or TFIDF_MODEL_PATH
+    with open(model_path, 'wb') as f:
+        pickle.dump(model, f)
+    _load_tfidf_model.cache_clear()
+    print(f"TF-IDF sentiment model saved to {model_path}")
+    
+    return model
+
+
+@lru_cache(maxsize=2)
+def _load_tfidf_model(model_path):
+    """Load (once per process) a model saved by train_tfidf_model"""
+    try:
+        with open(model_path, 'rb') as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"TF-IDF sentiment model not found at {model_path}. "
+                                f"Train one with train_tfidf_model()")
+
+
+def _tfidf_polarity(texts, model_path=None):
+    """Score comment texts with the trained TF-IDF model in one sparse matrix product"""
+    model = _load_tfidf_model(str(model_path or TFIDF_MODEL_PATH))
+    return np.clip(model.predict(texts), -1.0, 1.0)
+
+
+def analyze_sentiment_batch(comments_df, show_progress=True, n_jobs=None, use_swifter=False,
+                            backend='textblob'):
     """
     Calculate sentiment for all comments in DataFrame
     
     Args:
         comments_df: DataFrame with 'comment_text' column
-        show_progress: Whether to show progress bar
+        show_progress: Whether to show the progress bar and status messages
+            (off for per-page monitor calls, which would otherwise interleave)
+        n_jobs: Worker processes for TextBlob batches of PARALLEL_MIN_COMMENTS
+            or more (-1 for all CPUs; default: serial, no process pool)
+        use_swifter: Let swifter pick the execution strategy for large TextBlob
+            batches (ignored if swifter is not installed)
+        backend: Sentiment model - 'textblob', 'vader', 'hf' (HuggingFace) or
+            'tfidf' (model from train_tfidf_model)
     
     Returns:
         DataFrame with added 'Polarity' column
     """
     df = comments_df.copy()
     
-    print("Calculating sentiment for comments...")
-    
     if show_progress:
-        tqdm.pandas(desc="Processing comments")
-        df['Polarity'] = df['comment_text'].progress_apply(calculate_sentiment)
+        print("Calculating sentiment for comments...")
+    
+    # Score each distinct comment once ("First!", "🔥🔥🔥", ... repeat a lot)
+    # and map the scores back onto every row; the dedup and map run on an
+    # Arrow-backed copy, while the caller's comment_text column is left as is
+    texts = as_arrow_strings(df['comment_text'].fillna(''))
+    unique_texts = texts.drop_duplicates()
+    if backend == 'textblob':
+        scores = _textblob_polarity(unique_texts, show_progress, n_jobs, use_swifter)
+    elif backend == 'vader':
+        scores = _vader_polarity(unique_texts)
+    elif backend == 'hf':
+        scores = _hf_polarity(unique_texts)
+    elif backend == 'tfidf':
+        scores = _tfidf_polarity(unique_texts)
     else:
-        df['Polarity'] = df['comment_text'].apply(calculate_sentiment)
+        raise ValueError(f"Unknown sentiment backend: {backend}")
+    # Kept float64: rounding to float32 moves scores such as 0.10000000000000002
+    # onto the +/-0.1 category thresholds and flips their category
+    polarity = texts.map(dict(zip(unique_texts, scores))).to_numpy(dtype=np.float64)
+    df['Polarity'] = polarity
     
-    print(f"Sentiment analysis complete. Mean polarity: {df['Polarity'].mean():.3f}")
+    if show_progress:
+        # Reduce the bare ndarray: Series.mean's dispatch costs more than the sum itself
+        print(f"Sentiment analysis complete. Mean polarity: {polarity.mean(dtype=np.float64):.3f}")
     
     return df
 
@@ -88,10 +274,20 @@ def add_sentiment_categories(df):
         df: DataFrame with 'Polarity' column
     
     Returns:
-        DataFrame with added 'sentiment_category' column
+        DataFrame with added 'sentiment_category' column (ordered categorical)
     """
     df = df.copy()
-    df['sentiment_category'] = df['Polarity'].apply(categorize_sentiment)
+    # Vectorized equivalent of categorize_sentiment (same boundary inclusivity),
+    # producing category codes directly so each row is stored as one int8
+    polarity = df['Polarity'].to_numpy()
+    conditions = [
+        polarity < -0.5,
+        polarity < SENTIMENT_THRESHOLD_NEGATIVE,
+        polarity <= SENTIMENT_THRESHOLD_POSITIVE,
+        polarity <= 0.5,
+    ]
+    codes = np.select(conditions, [0, 1, 2, 3], default=4).astype(np.int8)
+    df['sentiment_category'] = pd.Categorical.from_codes(codes, dtype=SENTIMENT_CATEGORY_DTYPE)
     return df
 
 
@@ -107,16 +303,25 @@ def calculate_impact_score(df):
     """
     df = df.copy()
     
-    # Normalize sentiment to 0-1 scale
-    df['sentiment_normalized'] = (df['Polarity'] + 1) / 2
-    
-    # Calculate engagement score
+    # Calculate engagement-weighted score
     if 'likes' in df.columns and 'replies' in df.columns:
-        df['likes_numeric'] = pd.to_numeric(df['likes'], errors='coerce').fillna(0)
-        df['replies_numeric'] = pd.to_numeric(df['replies'], errors='coerce').fillna(0)
-        df['engagement_score'] = df['likes_numeric'] + df['replies_numeric']
-        df['engagement_log'] = np.log1p(df['engagement_score'])
-        df['impact_score'] = df['sentiment_normalized'] * (1 + df['engagement_log'])
+        # engagement_score (likes + replies) is kept for display; the rest is
+        # fused into one expression so only impact_score is materialized:
+        # normalized sentiment (0-1) * (1 + log1p(engagement))
+        likes = pd.to_numeric(df['likes'], errors='coerce').fillna(0).to_numpy(dtype=np.float64)
+        replies = pd.to_numeric(df['replies'], errors='coerce').fillna(0).to_numpy(dtype=np.float64)
+        engagement = likes + replies
+        df['engagement_score'] = engagement
+        pol = df['Polarity'].to_numpy(dtype=np.float32)
+        engagement = engagement.astype(np.float32)
+        if NUMEXPR_AVAILABLE:
+            impact = ne.evaluate(
+                "((pol + 1) * 0.5) * (1 + log1p(engagement))",
+                local_dict={'pol': pol, 'engagement': engagement}
+            )
+        else:
+            impact = ((pol + 1) * 0.5) * (1 + np.log1p(engagement))
+        df['impact_score'] = impact.astype(np.float32, copy=False)
     else:
         # If no engagement data, use absolute sentiment
         df['impact_score'] = df['Polarity'].abs()
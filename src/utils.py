@@ -6,8 +6,44 @@ import numpy as np
 import emoji
 from collections import Counter
 import re
+from functools import lru_cache
 from wordcloud import STOPWORDS
 
+try:
+    import pyarrow  # noqa: F401 - enables the 'string[pyarrow]' dtype
+    ARROW_STRINGS_AVAILABLE = True
+except ImportError:
+    ARROW_STRINGS_AVAILABLE = False
+
+# Built once; frozenset lookups are cheaper than going through emoji.EMOJI_DATA per char
+_EMOJI_SET = frozenset(emoji.EMOJI_DATA)
+
+_STOPWORDS = frozenset(STOPWORDS)
+
+
+@lru_cache(maxsize=8)
+def _kw_pattern(min_length):
+    """Compiled keyword pattern for words of at least min_length letters"""
+    return re.compile(rf'\b[a-z]{{{min_length},}}\b')
+
+
+def as_arrow_strings(texts):
+    """
+    Convert a Series to strings, Arrow-backed when pyarrow is installed
+    
+    Arrow-backed columns run .str methods (len, lower, count, findall, ...)
+    in Arrow's vectorized kernels instead of looping over Python objects.
+    
+    Args:
+        texts: Series of text values
+    
+    Returns:
+        Series with 'string[pyarrow]' dtype, or str values without pyarrow
+    """
+    if ARROW_STRINGS_AVAILABLE:
+        return texts.astype('string[pyarrow]')
+    return texts.astype(str)
+
 
 def extract_emojis(text):
     """
@@ -19,7 +55,20 @@ def extract_emojis(text):
     Returns:
         List of emojis found in text
     """
-    return [char for char in str(text) if char in emoji.EMOJI_DATA]
+    return [char for char in str(text) if char in _EMOJI_SET]
+
+
+def extract_emojis_series(texts):
+    """
+    Extract emojis from every text in a Series
+    
+    Args:
+        texts: Series of text strings
+    
+    Returns:
+        Series of emoji lists, aligned with the input index
+    """
+    return texts.fillna('').astype(str).map(extract_emojis)
 
 
 def calculate_comment_metrics(df):
@@ -33,8 +82,12 @@ def calculate_comment_metrics(df):
         DataFrame with added 'comment_length' and 'word_count' columns
     """
     df = df.copy()
-    df['comment_length'] = df['comment_text'].astype(str).str.len()
-    df['word_count'] = df['comment_text'].astype(str).str.split().str.len()
+    # Caller's column is left as is; missing text counts as empty so the
+    # metrics stay plain int64
+    text = df['comment_text'].fillna('').astype(str)
+    df['comment_length'] = text.str.len()
+    # Count whitespace-separated tokens without building a list per row
+    df['word_count'] = text.str.count(r'\S+')
     return df
 
 
@@ -51,9 +104,9 @@ def extract_keywords(text, min_length=3, stopwords=None):
         List of keywords
     """
     if stopwords is None:
-        stopwords = set(STOPWORDS)
+        stopwords = _STOPWORDS
     
-    words = re.findall(r'\b[a-z]{' + str(min_length) + r',}\b', str(text).lower())
+    words = _kw_pattern(min_length).findall(str(text).lower())
     return [w for w in words if w not in stopwords]
 
 
@@ -67,26 +120,29 @@ def get_word_sentiment_mapping(df):
     Returns:
         Dictionary mapping words to average sentiment scores
     """
-    all_word_sentiments = {}
-    
-    for idx, row in df.iterrows():
-        text = str(row['comment_text'])
-        sentiment = row['Polarity']
-        words = text.lower().split()
-        
-        for word in words:
-            # Remove punctuation
-            word = ''.join(c for c in word if c.isalnum())
-            if len(word) > 2 and word not in STOPWORDS:
-                if word not in all_word_sentiments:
-                    all_word_sentiments[word] = []
-                all_word_sentiments[word].append(sentiment)
-    
-    # Calculate average sentiment per word
-    word_avg_sentiment = {
-        word: np.mean(sents) 
-        for word, sents in all_word_sentiments.items() 
-        if len(sents) >= 3
-    }
+    # Tokenize on whitespace and aggregate per word with a single groupby
+    # instead of a per-row loop
+    words = df['comment_text'].astype(str).str.lower().str.split()
+    tokens = pd.DataFrame({'word': words, 'sentiment': df['Polarity']}).explode('word')
+    tokens = tokens.dropna(subset=['word'])
+    
+    # Remove punctuation and filter once per distinct token rather than once
+    # per occurrence; tokens that don't qualify map to NaN and are dropped
+    cleaned = {}
+    for token in tokens['word'].unique():
+        word = ''.join(c for c in token if c.isalnum())
+        if len(word) > 2 and word not in _STOPWORDS:
+            cleaned[token] = word
+    tokens['word'] = tokens['word'].map(cleaned)
+    tokens = tokens.dropna(subset=['word'])
+    
+    # Calculate average sentiment per word: integer-encode words, then
+    # reduce sums and counts per word id with bincount
+    word_ids, vocab = pd.factorize(tokens['word'])
+    sentiments = tokens['sentiment'].to_numpy(dtype=np.float64)
+    sums = np.bincount(word_ids, weights=sentiments, minlength=len(vocab))
+    counts = np.bincount(word_ids, minlength=len(vocab))
+    keep = counts >= 3
+    word_avg_sentiment = dict(zip(vocab[keep], (sums[keep] / counts[keep]).tolist()))
     
     return word_avg_sentiment
@@ -1,7 +1,10 @@
 """
 Visualization functions
 """
+import matplotlib
+matplotlib.use('Agg')  # Plots are only saved to files; skip interactive backend setup
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import seaborn as sns
 import pandas as pd
 import numpy as np
@@ -11,11 +14,41 @@ from pathlib import Path
 from .config import FIGURES_DIR, FIGURE_SIZE, DPI
 
 
+_STYLE_DONE = False
+_FIGURES = {}
+
+
 def setup_style():
-    """Setup matplotlib style"""
+    """Setup matplotlib style (applied once per process)"""
+    global _STYLE_DONE
+    if _STYLE_DONE:
+        return
+    _STYLE_DONE = True
     sns.set_style("whitegrid")
-    plt.rcParams['figure.dpi'] = DPI
-    plt.rcParams['savefig.dpi'] = DPI
+    plt.rcParams.update({'figure.dpi': DPI, 'savefig.dpi': DPI})
+
+
+def _get_figure(name, figsize, nrows=1, ncols=1):
+    """
+    Get a cleared figure for a plot, reusing the one from the previous call
+    
+    Figures are created outside pyplot, so they are never shown or tracked
+    by the pyplot state machine and don't need plt.close().
+    
+    Args:
+        name: Cache key, one per plot type
+        figsize: Figure size used when the figure is first created
+        nrows, ncols: Subplot grid to create on the cleared figure
+    
+    Returns:
+        Tuple of (figure, axes)
+    """
+    fig = _FIGURES.get(name)
+    if fig is None:
+        fig = _FIGURES[name] = Figure(figsize=figsize)
+    else:
+        fig.clear()
+    return fig, fig.subplots(nrows, ncols)
 
 
 def plot_sentiment_distribution(df, save_path=None):
@@ -27,7 +60,7 @@ def plot_sentiment_distribution(df, save_path=None):
         save_path: Path to save figure (optional)
     """
     setup_style()
-    fig, ax = plt.subplots(figsize=FIGURE_SIZE)
+    fig, ax = _get_figure('sentiment_distribution', FIGURE_SIZE)
     sns.histplot(df['Polarity'], kde=True, bins=50, ax=ax, color='steelblue', alpha=0.7)
     ax.axvline(df['Polarity'].mean(), color='r', linestyle='--', linewidth=2, label=f"Mean: {df['Polarity'].mean():.3f}")
     ax.axvline(0, color='black', linestyle='-', linewidth=1, alpha=0.5, label='Neutral')
@@ -36,13 +69,12 @@ def plot_sentiment_distribution(df, save_path=None):
     ax.set_title('Sentiment Distribution', fontsize=14, fontweight='bold')
     ax.legend()
     ax.grid(alpha=0.3)
-    plt.tight_layout()
+    fig.tight_layout()
     
     if save_path:
-        plt.savefig(save_path)
+        fig.savefig(save_path)
     else:
-        plt.savefig(FIGURES_DIR / 'sentiment_distribution.png')
-    plt.close()
+        fig.savefig(FIGURES_DIR / 'sentiment_distribution.png')
 
 
 def plot_wordcloud(df, sentiment_filter=None, save_path=None):
@@ -71,24 +103,32 @@ def plot_wordcloud(df, sentiment_filter=None, save_path=None):
         print(f"No comments found for {sentiment_filter} filter")
         return
     
-    text = ' '.join(filtered_df['comment_text'].astype(str))
+    # Count words in pandas rather than handing WordCloud one giant string to
+    # re-tokenize; same token pattern as WordCloud, so non-ASCII words stay whole
+    words = filtered_df['comment_text'].astype(str).str.lower().str.findall(r"\w[\w']+").explode()
+    words = words[words.notna()]
+    words = words[(words.str.len() >= 3) & ~words.str.isdigit() & ~words.isin(STOPWORDS)]
+    freqs = words.value_counts().head(5000).to_dict()
+    
+    if not freqs:
+        print(f"No words found for {sentiment_filter} filter")
+        return
     
-    wordcloud = WordCloud(stopwords=set(STOPWORDS), width=1200, height=600,
+    wordcloud = WordCloud(width=1200, height=600,
                          background_color='white', colormap=colormap,
-                         max_words=200).generate(text)
+                         max_words=200).generate_from_frequencies(freqs)
     
-    plt.figure(figsize=(16, 8))
-    plt.imshow(wordcloud, interpolation='bilinear')
-    plt.axis('off')
-    plt.title(title, fontsize=16, fontweight='bold', pad=20)
-    plt.tight_layout()
+    fig, ax = _get_figure('wordcloud', (16, 8))
+    ax.imshow(wordcloud, interpolation='bilinear')
+    ax.axis('off')
+    ax.set_title(title, fontsize=16, fontweight='bold', pad=20)
+    fig.tight_layout()
     
     if save_path:
-        plt.savefig(save_path)
+        fig.savefig(save_path)
     else:
         filename = f'wordcloud_{sentiment_filter or "all"}.png'
-        plt.savefig(FIGURES_DIR / filename)
-    plt.close()
+        fig.savefig(FIGURES_DIR / filename)
 
 
 def plot_emoji_sentiment(emoji_df, save_path=None):
@@ -103,7 +143,7 @@ def plot_emoji_sentiment(emoji_df, save_path=None):
         return
     
     setup_style()
-    fig, axes = plt.subplots(1, 2, figsize=(16, 6))
+    fig, axes = _get_figure('emoji_sentiment', (16, 6), 1, 2)
     
     # Top positive emojis
     top_positive = emoji_df.head(15)
@@ -121,13 +161,12 @@ def plot_emoji_sentiment(emoji_df, save_path=None):
                      fontsize=13, fontweight='bold')
     axes[1].set_xlabel('Average Sentiment Polarity', fontsize=11)
     
-    plt.tight_layout()
+    fig.tight_layout()
     
     if save_path:
-        plt.savefig(save_path)
+        fig.savefig(save_path)
     else:
-        plt.savefig(FIGURES_DIR / 'emoji_sentiment.png')
-    plt.close()
+        fig.savefig(FIGURES_DIR / 'emoji_sentiment.png')
 
 
 def plot_sentiment_by_category(category_df, save_path=None):
@@ -142,22 +181,21 @@ def plot_sentiment_by_category(category_df, save_path=None):
         return
     
     setup_style()
-    fig, ax = plt.subplots(figsize=(14, 8))
+    fig, ax = _get_figure('sentiment_by_category', (14, 8))
     
     sns.boxplot(x='category', y='avg_sentiment', data=category_df, palette='Set3', ax=ax)
     ax.set_xlabel('Video Category', fontsize=12, fontweight='bold')
     ax.set_ylabel('Average Sentiment', fontsize=12, fontweight='bold')
     ax.set_title('Sentiment Distribution by Video Category', fontsize=14, fontweight='bold')
     ax.axhline(0, color='red', linestyle='--', linewidth=1, alpha=0.5)
-    plt.xticks(rotation=45, ha='right')
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
     ax.grid(axis='y', alpha=0.3)
-    plt.tight_layout()
+    fig.tight_layout()
     
     if save_path:
-        plt.savefig(save_path)
+        fig.savefig(save_path)
     else:
-        plt.savefig(FIGURES_DIR / 'sentiment_by_category.png')
-    plt.close()
+        fig.savefig(FIGURES_DIR / 'sentiment_by_category.png')
 
 
 def plot_correlation_heatmap(correlation_matrix, save_path=None):
@@ -172,17 +210,16 @@ def plot_correlation_heatmap(correlation_matrix, save_path=None):
         return
     
     setup_style()
-    plt.figure(figsize=(10, 8))
+    fig, ax = _get_figure('correlation_heatmap', (10, 8))
     sns.heatmap(correlation_matrix, annot=True, cmap='coolwarm', center=0,
-               square=True, linewidths=1, cbar_kws={"shrink": 0.8}, fmt='.3f')
-    plt.title('Correlation Matrix', fontsize=14, fontweight='bold')
-    plt.tight_layout()
+               square=True, linewidths=1, cbar_kws={"shrink": 0.8}, fmt='.3f', ax=ax)
+    ax.set_title('Correlation Matrix', fontsize=14, fontweight='bold')
+    fig.tight_layout()
     
     if save_path:
-        plt.savefig(save_path)
+        fig.savefig(save_path)
     else:
-        plt.savefig(FIGURES_DIR / 'correlation_heatmap.png')
-    plt.close()
+        fig.savefig(FIGURES_DIR / 'correlation_heatmap.png')
 
 
 def plot_sentiment_categories(df, save_path=None):
@@ -211,7 +248,7 @@ def plot_sentiment_categories(df, save_path=None):
     colors = ['#d62728', '#ff7f0e', '#bcbd22', '#2ca02c', '#1f77b4']
     filtered_colors = [colors[sentiment_order.index(cat)] for cat in filtered_cats]
     
-    fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+    fig, axes = _get_figure('sentiment_categories', (14, 6), 1, 2)
     
     # Pie chart (only with non-zero values)
     if len(filtered_counts) > 0 and sum(filtered_counts) > 0:
@@ -227,10 +264,9 @@ def plot_sentiment_categories(df, save_path=None):
     axes[1].tick_params(axis='x', rotation=15)
     axes[1].grid(axis='y', alpha=0.3)
     
-    plt.tight_layout()
+    fig.tight_layout()
     
     if save_path:
-        plt.savefig(save_path)
+        fig.savefig(save_path)
     else:
-        plt.savefig(FIGURES_DIR / 'sentiment_categories.png')
-    plt.close()
+        fig.savefig(FIGURES_DIR / 'sentiment_categories.png')
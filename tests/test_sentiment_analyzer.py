@@ -0,0 +1,121 @@
+"""
+Tests for the sentiment analyzer module
+"""
+import multiprocessing as mp
+
+import pandas as pd
+import pytest
+from textblob._text import EMOTICONS
+from textblob.en import sentiment as pattern_sentiment
+
+from src import sentiment_analyzer
+from src.config import PARALLEL_MIN_COMMENTS
+from src.sentiment_analyzer import (analyze_sentiment_batch, add_sentiment_categories,
+                                    calculate_sentiment)
+
+
+def _swifter_texts():
+    return pd.Series([f"great video number {i}" if i % 2 else f"awful clip {i}"
+                      for i in range(PARALLEL_MIN_COMMENTS)])
+
+
+def test_use_swifter_scores_through_swifter(monkeypatch):
+    swifter = pytest.importorskip('swifter')
+    calls = []
+    
+    def apply(self, func, *args, **kwargs):
+        calls.append(func)
+        return self._obj.map(func)
+    
+    monkeypatch.setattr(swifter.swifter.SeriesAccessor, 'apply', apply)
+    texts = _swifter_texts()
+    
+    scores = sentiment_analyzer._textblob_polarity(texts, show_progress=False, use_swifter=True)
+    
+    assert calls == [calculate_sentiment]
+    assert scores.tolist() == [calculate_sentiment(text) for text in texts]
+
+
+def test_use_swifter_falls_back_on_convert_dtype_error(monkeypatch):
+    swifter = pytest.importorskip('swifter')
+    
+    def apply(self, func, *args, **kwargs):
+        raise TypeError(f"{func.__name__}() got an unexpected keyword argument 'convert_dtype'")
+    
+    monkeypatch.setattr(swifter.swifter.SeriesAccessor, 'apply', apply)
+    texts = _swifter_texts()
+    
+    scores = sentiment_analyzer._textblob_polarity(texts, show_progress=False, use_swifter=True)
+    
+    assert list(scores) == [calculate_sentiment(text) for text in texts]
+
+
+def test_use_swifter_propagates_other_type_errors(monkeypatch):
+    swifter = pytest.importorskip('swifter')
+    
+    def apply(self, func, *args, **kwargs):
+        raise TypeError("unsupported operand")
+    
+    monkeypatch.setattr(swifter.swifter.SeriesAccessor, 'apply', apply)
+    
+    with pytest.raises(TypeError, match="unsupported operand"):
+        sentiment_analyzer._textblob_polarity(_swifter_texts(), show_progress=False, use_swifter=True)
+
+
+def _spy_pool(monkeypatch):
+    """Record mp.Pool sizes opened by the sentiment analyzer"""
+    opened = []
+    
+    def pool(processes):
+        opened.append(processes)
+        return mp.get_context().Pool(processes)
+    
+    monkeypatch.setattr(sentiment_analyzer.mp, 'Pool', pool)
+    return opened
+
+
+def test_textblob_pool_path_matches_serial(monkeypatch):
+    monkeypatch.setattr(sentiment_analyzer, 'PARALLEL_MIN_COMMENTS', 10)
+    opened = _spy_pool(monkeypatch)
+    texts = pd.Series([f"great video number {i}" if i % 3 else f"awful clip {i}" for i in range(40)])
+    
+    scores = sentiment_analyzer._textblob_polarity(texts, show_progress=False, n_jobs=2)
+    
+    assert opened == [2]
+    assert list(scores) == [calculate_sentiment(text) for text in texts]
+
+
+def test_textblob_stays_serial_without_n_jobs(monkeypatch):
+    monkeypatch.setattr(sentiment_analyzer, 'PARALLEL_MIN_COMMENTS', 10)
+    opened = _spy_pool(monkeypatch)
+    texts = pd.Series([f"great video number {i}" for i in range(40)])
+    
+    sentiment_analyzer._textblob_polarity(texts, show_progress=False)
+    
+    assert opened == []
+
+
+def test_polarity_keeps_scores_just_past_thresholds(monkeypatch):
+    scores = [0.10000000000000002, -0.10000000000000002, 0.1]
+    monkeypatch.setattr(sentiment_analyzer, '_textblob_polarity', lambda texts, *args: scores)
+    df = pd.DataFrame({'comment_text': ['a', 'b', 'c']})
+    
+    result = add_sentiment_categories(analyze_sentiment_batch(df, show_progress=False))
+    
+    assert result['Polarity'].tolist() == scores
+    assert result['sentiment_category'].tolist() == ['Positive', 'Negative', 'Neutral']
+
+
+@pytest.mark.parametrize('emoticon', sorted({e for emoticons in EMOTICONS.values() for e in emoticons}))
+def test_calculate_sentiment_matches_textblob_on_emoticons(emoticon):
+    for text in (emoticon, f"{emoticon} {emoticon}", f"123 {emoticon}"):
+        assert calculate_sentiment(text) == pattern_sentiment(text)[0]
+
+
+def test_analyze_sentiment_batch_leaves_comment_text_dtype():
+    df = pd.DataFrame({'comment_text': pd.Series(['good', None, 'good', 'bad'], dtype=object)})
+    
+    result = analyze_sentiment_batch(df, show_progress=False)
+    
+    assert result['comment_text'].dtype == object
+    assert result['Polarity'].tolist() == [calculate_sentiment(t) for t in ['good', '', 'good', 'bad']]
@@ -0,0 +1,78 @@
+"""
+Tests for the YouTube monitor module
+"""
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src import youtube_monitor
+from src.youtube_monitor import (_CHANNEL_URL_RE, ANALYSIS_STATUS_DTYPE, VideoSentimentSummary,
+                                 YouTubeSentimentMonitor, results_to_frame)
+
+
+@pytest.mark.parametrize('url, group, value', [
+    ('https://www.youtube.com/channel/UC1234567890abcdef', 'id', 'UC1234567890abcdef'),
+    ('https://youtube.com/channel/UCabc?view=0', 'id', 'UCabc'),
+    ('https://m.youtube.com/@SomeHandle/videos', 'handle', 'SomeHandle'),
+    ('youtube.com/c/SomeName', 'user', 'SomeName'),
+    ('http://www.youtube.com/user/LegacyName#about', 'user', 'LegacyName'),
+])
+def test_channel_url_re_parses_youtube_urls(url, group, value):
+    match = _CHANNEL_URL_RE.match(url)
+    
+    assert match is not None
+    assert match.group(group) == value
+
+
+@pytest.mark.parametrize('url', [
+    'https://example.com/channel/UC1234567890abcdef',
+    'https://notyoutube.com/channel/UC1234567890abcdef',
+    'https://youtube.com.example.com/channel/UC1234567890abcdef',
+    'https://example.com/?next=https://www.youtube.com/channel/UC1234567890abcdef',
+    'https://www.youtube.com/watch?v=dQw4w9WgXcQ',
+])
+def test_channel_url_re_rejects_other_urls(url):
+    assert _CHANNEL_URL_RE.match(url) is None
+
+
+def test_analysis_cache_is_bounded_under_concurrent_use(monkeypatch):
+    monkeypatch.setattr(youtube_monitor, 'ANALYSIS_CACHE_SIZE', 3)
+    monitor = object.__new__(YouTubeSentimentMonitor)
+    monitor._analysis_cache = OrderedDict()
+    monitor._analysis_lock = threading.Lock()
+    monitor._analyze_video_comments = lambda video_id, max_comments, include: (
+        VideoSentimentSummary(video_id, 'success', total_comments=max_comments))
+    
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(
+            lambda i: monitor.analyze_video_comments(f"video{i % 6}", 10), range(600)))
+    
+    assert [r.video_id for r in results] == [f"video{i % 6}" for i in range(600)]
+    assert len(monitor._analysis_cache) == 3
+
+
+def test_analysis_cache_skips_failures():
+    monitor = object.__new__(YouTubeSentimentMonitor)
+    monitor._analysis_cache = OrderedDict()
+    monitor._analysis_lock = threading.Lock()
+    monitor._analyze_video_comments = lambda video_id, max_comments, include: (
+        VideoSentimentSummary(video_id, 'no_comments'))
+    
+    monitor.analyze_video_comments('video', 10)
+    
+    assert not monitor._analysis_cache
+
+
+def test_results_to_frame_keeps_schema_when_empty():
+    summaries = [VideoSentimentSummary('a', 'success', total_comments=3),
+                 VideoSentimentSummary('b', 'no_comments', message='none')]
+    
+    full = results_to_frame(summaries)
+    empty = results_to_frame([])
+    
+    assert list(empty.columns) == list(full.columns)
+    assert full['status'].dtype == ANALYSIS_STATUS_DTYPE
+    assert empty['status'].dtype == ANALYSIS_STATUS_DTYPE
+    assert list(empty['status'].cat.categories) == list(ANALYSIS_STATUS_DTYPE.categories)